@@ -1,19 +1,140 @@
 import streamlit as st
-import requests
+import httpx
+import orjson
+import pandas as pd
 from typing import Optional, Tuple, Dict, Any, List
 from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from urllib.parse import quote
 import time
-import json
 from config import (
     OPENWEATHER_API_KEY,
     GEOCODING_URL,
     CURRENT_WEATHER_URL,
     FORECAST_URL,
     REQUEST_TIMEOUT,
-    CACHE_TTL
+    MAX_RETRIES,
+    WEATHER_TTL,
+    GEOCODE_TTL,
+    ERROR_CACHE_TTL,
+    ERROR_MESSAGES,
+    SESSION
 )
 
 
+@st.cache_resource(show_spinner=False)
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-wide thread pool for issuing independent API calls concurrently.
+
+    The client releases the GIL during network I/O, so both weather calls
+    overlap. st.cache_resource keeps one pool alive across reruns; a plain
+    module global would be rebuilt every time Streamlit re-executes this
+    script, churning threads.
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+
+EXECUTOR = _get_executor()
+
+@st.cache_resource(show_spinner=False)
+def _cache_stats_store() -> Dict[str, Dict[str, float]]:
+    """Process-wide fetch tallies: lookups per wrapper, real executions (misses) per body.
+
+    Streamlit exposes no public hit/miss stats for st.cache_data, and a plain
+    module global would reset on every script rerun, so the counters live in
+    one st.cache_resource-backed dict that accumulates across reruns.
+    """
+    return {
+        name: {"calls": 0, "misses": 0, "last_miss": 0.0}
+        for name in ("geocode", "current", "forecast")
+    }
+
+
+_CACHE_STATS = _cache_stats_store()
+
+
+def _record_call(name: str) -> None:
+    _CACHE_STATS[name]["calls"] += 1
+
+
+def _record_miss(name: str) -> None:
+    stats = _CACHE_STATS[name]
+    stats["misses"] += 1
+    stats["last_miss"] = time.time()
+
+# Static styling for the current-weather card. Built once at import; the
+# per-render gradient goes on the card div as an inline style instead of
+# being interpolated into this block on every call.
+_WEATHER_CSS = """
+    <style>
+    .weather-card {
+        color: white;
+        border-radius: 15px;
+        padding: 2.5rem;
+        text-align: center;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+    }
+
+    .conditions-title {
+        margin: 0 0 1rem 0;
+        font-size: 1.3rem;
+        color: var(--text-color);
+    }
+
+    .condition-card {
+        background: var(--background-color);
+        border-radius: 10px;
+        padding: 1rem;
+        margin-bottom: 1rem;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        border: 1px solid var(--border-color);
+    }
+
+    .condition-label {
+        font-size: 0.9rem;
+        color: var(--secondary-text-color);
+        margin-bottom: 0.3rem;
+    }
+
+    .condition-value {
+        font-size: 1.8rem;
+        font-weight: bold;
+        color: var(--text-color);
+    }
+
+    /* Light theme variables */
+    :root {
+        --background-color: white;
+        --text-color: #2c3e50;
+        --secondary-text-color: #666;
+        --border-color: rgba(0,0,0,0.1);
+    }
+
+    /* Dark theme variables */
+    @media (prefers-color-scheme: dark) {
+        :root {
+            --background-color: #262730;
+            --text-color: #ffffff;
+            --secondary-text-color: #a6a6a6;
+            --border-color: rgba(255,255,255,0.1);
+        }
+    }
+
+    /* Override for Streamlit dark theme */
+    .stApp[data-theme="dark"] {
+        --background-color: #262730;
+        --text-color: #ffffff;
+        --secondary-text-color: #a6a6a6;
+        --border-color: rgba(255,255,255,0.1);
+    }
+    </style>
+"""
+
 st.set_page_config(
     page_title="Weather Forecast",
     page_icon="🌤️",
@@ -21,6 +142,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Streamlit drops elements that are not re-emitted on a rerun, so the CSS
+# dedup flag only holds within a single script run
+st.session_state["_weather_css_injected"] = False
+
 # Main app header with simple styling
 st.title("🌤️ Weather Forecast App")
 st.markdown("*Get accurate weather forecasts for any location worldwide*")
@@ -33,8 +158,10 @@ with st.sidebar:
     if st.button("🏠 Reset to Home", help="Clear current location and return to home screen", use_container_width=True):
         # Clear session state
         for key in list(st.session_state.keys()):
-            if key in ['selected_suggestion', 'location_input', 'location_text_input']:
+            if key in ['location_input', 'location_text_input']:
                 del st.session_state[key]
+        # Drop any suggestion carried in the URL
+        st.query_params.clear()
         # Clear any cached data
         st.cache_data.clear()
         st.rerun()
@@ -74,41 +201,111 @@ with st.sidebar:
         - Free weather icons (emojis)
     """)
 
+    # Debug-only cache observability (enable via ?debug=1) for tuning TTLs
+    # and max_entries without paying for it on normal renders. The sidebar
+    # renders before this run's fetches execute, so the panel shows totals
+    # accumulated up to the previous script pass.
+    if st.query_params.get("debug"):
+        with st.expander("📊 Cache stats"):
+            for name, stats in _CACHE_STATS.items():
+                calls = int(stats["calls"])
+                misses = int(stats["misses"])
+                hits = calls - misses
+                ratio = hits / calls if calls else 0.0
+                last_miss = (
+                    datetime.fromtimestamp(stats["last_miss"]).strftime("%H:%M:%S")
+                    if stats["last_miss"] else "never"
+                )
+                st.write(f"**{name}**: {hits} hits / {misses} misses ({ratio:.0%}), last fetch {last_miss}")
+
+
+@st.cache_resource(show_spinner=False)
+def _failed_fetches_store() -> Dict[Tuple[Any, ...], Tuple[float, str]]:
+    """Process-wide negative cache for failed fetches.
+
+    st.cache_data never stores raised exceptions, so without this every rerun
+    during an outage would re-hit the API (and its rate limit). The dict has
+    to come from st.cache_resource — a plain module global would be emptied
+    on each script rerun — and keeps the failure window at ERROR_CACHE_TTL
+    instead of the much longer positive TTLs.
+    """
+    return {}
+
+
+_FAILED_FETCHES = _failed_fetches_store()
+
+
+def _recent_failure(key: Tuple[Any, ...]) -> Optional[str]:
+    entry = _FAILED_FETCHES.get(key)
+    if entry is None:
+        return None
+    until, message = entry
+    if time.time() < until:
+        return message
+    del _FAILED_FETCHES[key]
+    return None
+
+
+def _record_failure(key: Tuple[Any, ...], message: str) -> str:
+    _FAILED_FETCHES[key] = (time.time() + ERROR_CACHE_TTL, message)
+    return message
+
 
-@st.cache_data(ttl=CACHE_TTL)
-def get_coordinates(location: str) -> Tuple[Optional[float], Optional[float], Optional[str], Optional[str], Optional[str]]:
+# persist="disk" keeps warm entries across server restarts; the app already
+# shows its own spinner, so the per-call cache spinner is disabled
+@st.cache_data(ttl=GEOCODE_TTL, max_entries=2048, persist="disk", show_spinner=False)
+def _get_coordinates_cached(location: str) -> Tuple[Optional[float], Optional[float], Optional[str], Optional[str], Optional[str]]:
     """Get coordinates and location info from location name using OpenWeatherMap Geocoding API."""
+    _record_miss("geocode")
     params = {
         "q": location,
         "limit": 1,
         "appid": OPENWEATHER_API_KEY
     }
 
-    try:
-        response = requests.get(GEOCODING_URL, params=params, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-
-        data = response.json()
-        if data:
-            location_data = data[0]
-            return (
-                location_data["lat"],
-                location_data["lon"],
-                location_data.get("name"),
-                location_data.get("country"),
-                location_data.get("state")
-            )
-    except requests.RequestException as e:
-        st.error(f"Error fetching location data: {e}")
-    except (KeyError, IndexError) as e:
-        st.error(f"Error parsing location data: {e}")
+    response = SESSION.get(GEOCODING_URL, params=params)
+    response.raise_for_status()
+
+    # orjson takes the raw bytes directly, skipping the UTF-8 decode
+    # that .json()/.text would do
+    data = orjson.loads(response.content)
+    if data:
+        location_data = data[0]
+        return (
+            location_data["lat"],
+            location_data["lon"],
+            location_data.get("name"),
+            location_data.get("country"),
+            location_data.get("state")
+        )
 
     return None, None, None, None, None
 
 
-@st.cache_data(ttl=CACHE_TTL)
-def get_current_weather(lat: float, lon: float, units: str) -> Optional[Dict[str, Any]]:
+def get_coordinates(location: str) -> Tuple[Tuple[Optional[float], Optional[float], Optional[str], Optional[str], Optional[str]], Optional[str]]:
+    """Geocode a location, returning ((lat, lon, name, country, state), error_message)."""
+    _record_call("geocode")
+    normalized = " ".join(location.split()).lower()
+    key = ("geocode", normalized)
+
+    failure = _recent_failure(key)
+    if failure:
+        return (None, None, None, None, None), failure
+
+    try:
+        return _get_coordinates_cached(normalized), None
+    except httpx.HTTPError as e:
+        message = _record_failure(key, f"Error fetching location data: {e}")
+    except (orjson.JSONDecodeError, KeyError, IndexError) as e:
+        message = _record_failure(key, f"Error parsing location data: {e}")
+
+    return (None, None, None, None, None), message
+
+
+@st.cache_data(ttl=WEATHER_TTL, max_entries=256, persist="disk", show_spinner=False)
+def _get_current_weather_cached(lat: float, lon: float, units: str) -> Dict[str, Any]:
     """Get current weather data from OpenWeatherMap API."""
+    _record_miss("current")
     params = {
         "lat": lat,
         "lon": lon,
@@ -116,19 +313,30 @@ def get_current_weather(lat: float, lon: float, units: str) -> Optional[Dict[str
         "units": units
     }
 
-    try:
-        response = requests.get(CURRENT_WEATHER_URL, params=params, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        st.error(f"Error fetching current weather: {e}")
+    response = SESSION.get(CURRENT_WEATHER_URL, params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
-    return None
+
+def get_current_weather(lat: float, lon: float, units: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Get current weather as (data, error_message), with coordinates rounded to ~1 km for caching."""
+    _record_call("current")
+    key = ("current", round(lat, 2), round(lon, 2), units)
+
+    failure = _recent_failure(key)
+    if failure:
+        return None, failure
+
+    try:
+        return _get_current_weather_cached(round(lat, 2), round(lon, 2), units), None
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        return None, _record_failure(key, f"Error fetching current weather: {e}")
 
 
-@st.cache_data(ttl=CACHE_TTL)
-def get_forecast(lat: float, lon: float, units: str) -> Optional[Dict[str, Any]]:
-    """Get forecast data from OpenWeatherMap API."""
+@st.cache_data(ttl=WEATHER_TTL, max_entries=256, persist="disk", show_spinner=False)
+def _get_forecast_cached(lat: float, lon: float, units: str) -> Dict[str, Any]:
+    """Get forecast data from OpenWeatherMap API, keeping only the entry list."""
+    _record_miss("forecast")
     params = {
         "lat": lat,
         "lon": lon,
@@ -136,18 +344,40 @@ def get_forecast(lat: float, lon: float, units: str) -> Optional[Dict[str, Any]]
         "units": units
     }
 
+    response = SESSION.get(FORECAST_URL, params=params)
+    response.raise_for_status()
+    # The full payload is downloaded regardless, so cache the whole entry
+    # list once per location/units and let display_forecast slice it to the
+    # selected period; only the unused city/cnt metadata is dropped
+    return {"list": orjson.loads(response.content)["list"]}
+
+
+def get_forecast(lat: float, lon: float, units: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Get the forecast as (data, error_message), with coordinates rounded to ~1 km for caching."""
+    _record_call("forecast")
+    key = ("forecast", round(lat, 2), round(lon, 2), units)
+
+    failure = _recent_failure(key)
+    if failure:
+        return None, failure
+
     try:
-        response = requests.get(FORECAST_URL, params=params, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        st.error(f"Error fetching forecast data: {e}")
+        return _get_forecast_cached(round(lat, 2), round(lon, 2), units), None
+    except (httpx.HTTPError, orjson.JSONDecodeError, KeyError) as e:
+        return None, _record_failure(key, f"Error fetching forecast data: {e}")
 
-    return None
 
+def wait_for(future: Future) -> Tuple[Optional[Any], Optional[str]]:
+    """Wait for a prefetched API call, treating a stuck request as a fetch failure."""
+    try:
+        # Leave headroom for the session's retries before giving up
+        return future.result(timeout=REQUEST_TIMEOUT * (MAX_RETRIES + 1))
+    except FutureTimeoutError:
+        return None, ERROR_MESSAGES["api_error"]
 
-def get_weather_emoji(weather_id: int, icon: str, is_day: bool = True) -> str:
-    """Get appropriate emoji for weather condition as a free alternative to weather icons."""
+
+def _emoji_for(weather_id: int, is_day: bool) -> str:
+    """Classify a weather condition code into an emoji (used to build the lookup tables)."""
     # Thunderstorm group (200-232)
     if 200 <= weather_id <= 232:
         return "⛈️"
@@ -198,8 +428,8 @@ def get_weather_emoji(weather_id: int, icon: str, is_day: bool = True) -> str:
     return "🌤️"
 
 
-def get_weather_gradient(weather_id: int, is_day: bool = True) -> str:
-    """Get CSS gradient based on weather condition for enhanced visual appeal."""
+def _gradient_for(weather_id: int, is_day: bool) -> str:
+    """Classify a weather condition code into a CSS gradient (used to build the lookup tables)."""
     if 200 <= weather_id <= 232:  # Thunderstorm
         return "linear-gradient(135deg, #2c3e50, #3498db)"
     elif 300 <= weather_id <= 531:  # Rain/Drizzle
@@ -219,10 +449,45 @@ def get_weather_gradient(weather_id: int, is_day: bool = True) -> str:
         return "linear-gradient(135deg, #1e90ff, #4dabf7)"
 
 
+@st.cache_resource(show_spinner=False)
+def _weather_tables() -> Tuple[List[str], List[str], List[str], List[str]]:
+    """Build the emoji/gradient lookup tables indexed by weather condition id.
+
+    st.cache_resource runs the if/elif ladders once per process rather than
+    on every script rerun, so the per-entry hot path stays a single list
+    subscript without paying the table build per interaction.
+    """
+    return (
+        [_emoji_for(wid, True) for wid in range(805)],
+        [_emoji_for(wid, False) for wid in range(805)],
+        [_gradient_for(wid, True) for wid in range(805)],
+        [_gradient_for(wid, False) for wid in range(805)],
+    )
+
+
+_EMOJI_DAY, _EMOJI_NIGHT, _GRADIENT_DAY, _GRADIENT_NIGHT = _weather_tables()
+
+
+def get_weather_emoji(weather_id: int, icon: str, is_day: bool = True) -> str:
+    """Get appropriate emoji for weather condition as a free alternative to weather icons."""
+    if 0 <= weather_id < 805:
+        return (_EMOJI_DAY if is_day else _EMOJI_NIGHT)[weather_id]
+    return "🌤️"
+
+
+def get_weather_gradient(weather_id: int, is_day: bool = True) -> str:
+    """Get CSS gradient based on weather condition for enhanced visual appeal."""
+    if 0 <= weather_id < 805:
+        return (_GRADIENT_DAY if is_day else _GRADIENT_NIGHT)[weather_id]
+    return "linear-gradient(135deg, #1e90ff, #4dabf7)"
+
+
+@lru_cache(maxsize=1024)
 def format_datetime(dt_txt: str) -> Tuple[str, str]:
     """Format datetime string to a more readable format."""
     try:
-        dt = datetime.strptime(dt_txt, "%Y-%m-%d %H:%M:%S")
+        # fromisoformat is a pure-C parse, ~10x faster than strptime
+        dt = datetime.fromisoformat(dt_txt)
         date_str = dt.strftime("%a, %b %d")
         time_str = dt.strftime("%I:%M %p")
         return date_str, time_str
@@ -230,23 +495,39 @@ def format_datetime(dt_txt: str) -> Tuple[str, str]:
         return dt_txt, ""
 
 
+_DIRECTIONS = [
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
+]
+@st.cache_resource(show_spinner=False)
+def _wind_direction_table() -> List[str]:
+    """One compass direction per whole degree, built once per process.
+
+    Keeps the per-row call a single array load (360, not 361, so the modulo
+    wraps correctly) without recomputing the table on every script rerun.
+    """
+    return [_DIRECTIONS[round(d / 22.5) % 16] for d in range(360)]
+
+
+_WIND_DIR_BY_DEG = _wind_direction_table()
+
+
 def get_wind_direction(deg: float) -> str:
     """Convert wind degree to compass direction."""
-    directions = [
-        "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-        "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-    ]
-    index = round(deg / 22.5) % 16
-    return directions[index]
+    return _WIND_DIR_BY_DEG[int(deg) % 360]
 
 
 def display_current_weather(weather_data: Dict[str, Any], units: str, city: Optional[str], country: Optional[str], state: Optional[str] = None):
     """Display current weather in a beautiful card format."""
-    temp = weather_data["main"]["temp"]
-    feels_like = weather_data["main"]["feels_like"]
-    description = weather_data["weather"][0]["description"]
-    weather_id = weather_data["weather"][0]["id"]
-    icon = weather_data["weather"][0]["icon"]
+    # Bind the nested dicts once instead of re-walking them per field
+    main = weather_data["main"]
+    w0 = weather_data["weather"][0]
+
+    temp = main["temp"]
+    feels_like = main["feels_like"]
+    description = w0["description"]
+    weather_id = w0["id"]
+    icon = w0["icon"]
 
     # Weather icon system
     is_day = "d" in icon
@@ -266,104 +547,42 @@ def display_current_weather(weather_data: Dict[str, Any], units: str, city: Opti
     unit_symbol = "°C" if units == "metric" else "°F"
 
     # Get all the weather data
-    humidity = weather_data["main"]["humidity"]
-    pressure = weather_data["main"]["pressure"]
-
-    # Get wind data if available
-    wind_html = ""
-    if "wind" in weather_data:
-        wind_speed = weather_data["wind"]["speed"]
-        wind_deg = weather_data["wind"].get("deg", 0)
-        wind_dir = get_wind_direction(wind_deg)
-        wind_unit = "m/s" if units == "metric" else "mph"
-        wind_html = f"""<div class='condition-card' style='border-left: 4px solid #27ae60;'>
-                    <div class='condition-label'>💨 Wind {wind_dir}</div>
-                    <div class='condition-value'>{wind_speed:.1f} {wind_unit}</div>
-                </div>"""
-
-    # Get visibility data if available
-    visibility_html = ""
-    if "visibility" in weather_data:
-        visibility = weather_data["visibility"] / 1000  # Convert to km
-        vis_unit = "km" if units == "metric" else "mi"
+    humidity = main["humidity"]
+    pressure = main["pressure"]
+
+    # Optional condition cards, interpolated into the single render below
+    wind = weather_data.get("wind")
+    wind_unit = "m/s" if units == "metric" else "mph"
+    wind_html = (
+        f"<div class='condition-card' style='border-left: 4px solid #27ae60;'>"
+        f"<div class='condition-label'>💨 Wind {get_wind_direction(wind.get('deg', 0))}</div>"
+        f"<div class='condition-value'>{wind['speed']:.1f} {wind_unit}</div>"
+        f"</div>"
+    ) if wind else ""
+
+    visibility = weather_data.get("visibility")
+    vis_unit = "km" if units == "metric" else "mi"
+    if visibility is not None:
+        visibility = visibility / 1000  # Convert to km
         if units == "imperial":
             visibility = visibility * 0.621371  # Convert to miles
-        visibility_html = f"""<div class='condition-card' style='border-left: 4px solid #f39c12;'>
-                    <div class='condition-label'>👁️ Visibility</div>
-                    <div class='condition-value'>{visibility:.1f} {vis_unit}</div>
-                </div>"""
+    visibility_html = (
+        f"<div class='condition-card' style='border-left: 4px solid #f39c12;'>"
+        f"<div class='condition-label'>👁️ Visibility</div>"
+        f"<div class='condition-value'>{visibility:.1f} {vis_unit}</div>"
+        f"</div>"
+    ) if visibility is not None else ""
+
+    # Inject the static CSS once per script run; only the dynamic card HTML
+    # below is re-interpolated on each call
+    if not st.session_state.get("_weather_css_injected"):
+        st.markdown(_WEATHER_CSS, unsafe_allow_html=True)
+        st.session_state["_weather_css_injected"] = True
 
     # Create a container with equal height columns using flex
     st.markdown(f"""
-        <style>
-        .weather-card {{
-            background: {weather_gradient};
-            color: white;
-            border-radius: 15px;
-            padding: 2.5rem;
-            text-align: center;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-        }}
-        
-        .conditions-title {{
-            margin: 0 0 1rem 0;
-            font-size: 1.3rem;
-            color: var(--text-color);
-        }}
-        
-        .condition-card {{
-            background: var(--background-color);
-            border-radius: 10px;
-            padding: 1rem;
-            margin-bottom: 1rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            border: 1px solid var(--border-color);
-        }}
-        
-        .condition-label {{
-            font-size: 0.9rem;
-            color: var(--secondary-text-color);
-            margin-bottom: 0.3rem;
-        }}
-        
-        .condition-value {{
-            font-size: 1.8rem;
-            font-weight: bold;
-            color: var(--text-color);
-        }}
-        
-        /* Light theme variables */
-        :root {{
-            --background-color: white;
-            --text-color: #2c3e50;
-            --secondary-text-color: #666;
-            --border-color: rgba(0,0,0,0.1);
-        }}
-        
-        /* Dark theme variables */
-        @media (prefers-color-scheme: dark) {{
-            :root {{
-                --background-color: #262730;
-                --text-color: #ffffff;
-                --secondary-text-color: #a6a6a6;
-                --border-color: rgba(255,255,255,0.1);
-            }}
-        }}
-        
-        /* Override for Streamlit dark theme */
-        .stApp[data-theme="dark"] {{
-            --background-color: #262730;
-            --text-color: #ffffff;
-            --secondary-text-color: #a6a6a6;
-            --border-color: rgba(255,255,255,0.1);
-        }}
-        </style>
-        
         <div style='display: flex; gap: 2rem; align-items: stretch; margin-bottom: 2rem;'>
-            <div style='flex: 1;' class='weather-card'>
+            <div style='flex: 1; background: {weather_gradient};' class='weather-card'>
                 <h3 style='margin: 0; color: white; font-size: 1.8rem; font-weight: 600;'>{location_str}</h3>
                 <div style='font-size: 6rem; margin: 1.5rem 0; filter: drop-shadow(0 4px 8px rgba(0,0,0,0.3));'>
                     {weather_emoji}
@@ -398,69 +617,136 @@ def display_forecast(forecast_data: Dict[str, Any], units: str, hours: int):
 
     st.subheader(f"📅 {hours}-Hour Detailed Forecast")
 
-    # Group forecasts by day for better organization
-    forecasts_by_day = {}
-    for i, entry in enumerate(forecast_data["list"][:entries_to_show]):
-        dt = datetime.strptime(entry["dt_txt"], "%Y-%m-%d %H:%M:%S")
-        day_key = dt.strftime("%Y-%m-%d")
-
-        if day_key not in forecasts_by_day:
-            forecasts_by_day[day_key] = []
-        forecasts_by_day[day_key].append(entry)
-
-    for day_key, day_forecasts in forecasts_by_day.items():
-        day_date = datetime.strptime(day_key, "%Y-%m-%d")
-        st.markdown(f"#### {day_date.strftime('%A, %B %d')}")
-
-        for entry in day_forecasts:
-            dt_txt = entry["dt_txt"]
-            temp = entry["main"]["temp"]
-            temp_min = entry["main"]["temp_min"]
-            temp_max = entry["main"]["temp_max"]
-            weather = entry["weather"][0]["description"]
-            weather_id = entry["weather"][0]["id"]
-            icon = entry["weather"][0]["icon"]
-            humidity = entry["main"]["humidity"]
-
-            # Weather details
-            wind_speed = entry.get("wind", {}).get("speed", 0)
-            clouds = entry.get("clouds", {}).get("all", 0)
-            pop = entry.get("pop", 0) * 100  # Probability of precipitation
-
-            is_day = "d" in icon
-            weather_emoji = get_weather_emoji(weather_id, icon, is_day)
-
-            date_str, time_str = format_datetime(dt_txt)
-
-            # Create forecast card
-            col1, col2, col3 = st.columns([1, 2, 1])
-
-            with col1:
-                st.markdown(f"""
+    # An empty entry list would normalize into a frame with no columns and
+    # crash the derivations below
+    if not forecast_data["list"]:
+        st.info("No forecast entries are available for this location right now.")
+        return
+
+    # Flatten the nested entries into one frame instead of per-row dict walks
+    df = pd.json_normalize(forecast_data["list"][:entries_to_show])
+    # The API's unix timestamp field skips string parsing entirely
+    df["dt_parsed"] = pd.to_datetime(df["dt"], unit="s")
+    df["day"] = df["dt_parsed"].dt.strftime("%Y-%m-%d")
+
+    # weather is a one-element list per entry; unwrap it once and pull out
+    # the rendered fields instead of re-indexing per column
+    weather0 = [w[0] for w in df["weather"]]
+    df["weather_desc"] = [w["description"] for w in weather0]
+    df["weather_id"] = [w["id"] for w in weather0]
+    df["icon"] = [w["icon"] for w in weather0]
+
+    # Optional fields may be missing from individual entries or entirely
+    df["wind_speed"] = df.get("wind.speed", pd.Series(0, index=df.index)).fillna(0)
+    df["clouds"] = df.get("clouds.all", pd.Series(0, index=df.index)).fillna(0)
+    df["pop_pct"] = df.get("pop", pd.Series(0, index=df.index)).fillna(0) * 100
+
+    df = df.rename(columns={
+        "main.temp": "temp",
+        "main.temp_min": "temp_min",
+        "main.temp_max": "temp_max",
+        "main.humidity": "humidity",
+    })
+
+    wind_unit = "m/s" if units == "metric" else "mph"
+
+    # Accumulate the whole forecast as one HTML string so Streamlit sends a
+    # single delta message instead of several widgets per entry
+    parts: List[str] = []
+    # The API returns entries presorted ascending in time, so group keys are
+    # monotonic; sort=False skips the redundant key sort and keeps API order
+    for day_key, day_df in df.groupby("day", sort=False):
+        day_date = datetime.fromisoformat(day_key)
+        parts.append(f"<h4>{day_date.strftime('%A, %B %d')}</h4>")
+
+        for row in day_df.itertuples(index=False):
+            is_day = "d" in row.icon
+            weather_emoji = get_weather_emoji(row.weather_id, row.icon, is_day)
+
+            date_str, time_str = format_datetime(row.dt_txt)
+            pop_html = f"<div>☔ {row.pop_pct:.0f}%</div>" if row.pop_pct > 0 else ""
+
+            parts.append(f"""
+            <div style='display: grid; grid-template-columns: 1fr 2fr 1fr; align-items: center; gap: 0.5rem; padding: 0.6rem 0; border-bottom: 1px solid rgba(128,128,128,0.25);'>
                 <div style='text-align: center;'>
                     <div style='font-size: 2.5rem;'>{weather_emoji}</div>
                     <div style='font-size: 0.8rem;'>{time_str}</div>
                 </div>
-                """, unsafe_allow_html=True)
+                <div>
+                    <div><strong>{row.temp:.1f}{unit_symbol}</strong> - {row.weather_desc.title()}</div>
+                    <div>H: {row.temp_max:.0f}° L: {row.temp_min:.0f}° | 💧 {row.humidity}%</div>
+                </div>
+                <div>
+                    <div>💨 {row.wind_speed:.1f} {wind_unit}</div>
+                    <div>☁️ {row.clouds:.0f}%</div>
+                    {pop_html}
+                </div>
+            </div>""")
+
+    st.markdown("".join(parts), unsafe_allow_html=True)
+
+
+@st.fragment
+def render_current(future: Future, units: str, city: Optional[str], country: Optional[str], state: Optional[str]):
+    """Current-weather tab body; as a fragment it reruns alone instead of the whole script."""
+    current_weather, error = wait_for(future)
+    if current_weather:
+        display_current_weather(current_weather, units, city, country, state)
+    else:
+        st.error(error or "❌ Could not retrieve current weather data. Please try again.")
+
+
+@st.fragment
+def render_forecast(future: Future, units: str, hours: int):
+    """Forecast tab body; as a fragment it reruns alone instead of the whole script."""
+    forecast, error = wait_for(future)
+    if forecast:
+        display_forecast(forecast, units, hours)
+    else:
+        st.error(error or "❌ Could not retrieve forecast data. Please try again.")
 
-            with col2:
-                st.markdown(f"**{temp:.1f}{unit_symbol}** - {weather.title()}")
-                st.markdown(f"H: {temp_max:.0f}° L: {temp_min:.0f}° | 💧 {humidity}%")
 
-            with col3:
-                st.markdown(f"💨 {wind_speed:.1f} {'m/s' if units == 'metric' else 'mph'}")
-                st.markdown(f"☁️ {clouds}%")
-                if pop > 0:
-                    st.markdown(f"☔ {pop:.0f}%")
+@st.fragment
+def render_details(future: Future, lat: float, lon: float, show_details: bool):
+    """Details tab body; as a fragment it reruns alone instead of the whole script."""
+    current_weather, _ = wait_for(future)
+    if show_details and current_weather:
+        st.subheader("📊 Additional Information")
 
-            st.divider()
+        col1, col2 = st.columns(2)
 
+        with col1:
+            st.markdown("**🌅 Sun & Moon**")
+            sys_data = current_weather.get("sys")
+            if sys_data:
+                sunrise_ts = sys_data["sunrise"]
+                sunset_ts = sys_data["sunset"]
 
-# Handle suggestion button clicks and reset functionality
-suggestion_value = ""
-if 'selected_suggestion' in st.session_state and st.session_state.selected_suggestion:
-    suggestion_value = st.session_state.selected_suggestion
-    st.session_state.selected_suggestion = None  # Clear the suggestion
+                st.write(f"🌅 Sunrise: **{datetime.fromtimestamp(sunrise_ts).strftime('%I:%M %p')}**")
+                st.write(f"🌇 Sunset: **{datetime.fromtimestamp(sunset_ts).strftime('%I:%M %p')}**")
+
+                # Check if it's currently day or night by comparing raw unix
+                # seconds; no wall-clock wraparound ambiguity
+                if sunrise_ts <= time.time() <= sunset_ts:
+                    st.write("🌞 Currently: **Daytime**")
+                else:
+                    st.write("🌙 Currently: **Nighttime**")
+
+        with col2:
+            st.markdown("**📍 Location Details**")
+            st.write(f"📍 Coordinates: **{lat:.4f}, {lon:.4f}**")
+            if "timezone" in current_weather:
+                timezone_offset = current_weather["timezone"]
+                offset_hours = timezone_offset // 3600
+                st.write(f"🕐 Timezone: **UTC{offset_hours:+d}**")
+
+    else:
+        st.info("Enable 'Show detailed metrics' in the sidebar to see more information.")
+
+
+# Suggestion links land back here with ?loc=<name>; one query-param read
+# replaces the old per-button session-state round trip
+suggestion_value = st.query_params.get("loc", "")
 
 # Main app content with location input
 st.subheader("🔍 Enter a location")
@@ -503,13 +789,23 @@ if not location or location.strip() == "":
         ("🎭", "Rio de Janeiro", "Rio de Janeiro, Brazil")
     ]
 
-    # Create suggestion buttons in a grid
-    cols = st.columns(4)
-    for i, (emoji, city, full_name) in enumerate(suggestions):
-        with cols[i % 4]:
-            if st.button(f"{emoji} {city}", key=f"suggestion_{i}", help=f"Search for {full_name}"):
-                st.session_state.selected_suggestion = full_name
-                st.rerun()
+    # Render the suggestions as one HTML grid of links instead of 12 button
+    # widgets; each link reruns the script with ?loc=<name> set
+    links = "".join(
+        f"<a class='suggest-btn' href='?loc={quote(full_name)}' target='_self' title='Search for {full_name}'>{emoji} {city}</a>"
+        for emoji, city, full_name in suggestions
+    )
+    st.markdown(
+        "<style>"
+        ".suggest-grid { display: grid; grid-template-columns: repeat(4, 1fr); gap: 0.5rem; }"
+        ".suggest-btn { display: block; text-align: center; padding: 0.5rem 0.75rem;"
+        " border: 1px solid rgba(128,128,128,0.4); border-radius: 8px;"
+        " text-decoration: none; color: inherit; }"
+        ".suggest-btn:hover { border-color: #ff4b4b; color: #ff4b4b; }"
+        "</style>"
+        f"<div class='suggest-grid'>{links}</div>",
+        unsafe_allow_html=True,
+    )
 
     # Add some tips
     st.info("""
@@ -523,66 +819,33 @@ if not location or location.strip() == "":
 else:
     with st.spinner("🌐 Fetching weather data..."):
         # Get coordinates
-        lat, lon, city, country, state = get_coordinates(location)
+        (lat, lon, city, country, state), geo_error = get_coordinates(location)
 
         if lat is not None and lon is not None:
+            # Prefetch both weather calls as soon as the coordinates are known;
+            # by the time each tab body blocks on its future, the response is
+            # usually already in st.cache_data
+            futures = {
+                "current": EXECUTOR.submit(get_current_weather, lat, lon, units),
+                "forecast": EXECUTOR.submit(get_forecast, lat, lon, units),
+            }
+
             # Display current weather and forecast in tabs for better organization
             tab1, tab2, tab3 = st.tabs(["🌤️ Current Weather", "📅 Forecast", "📊 Details"])
 
             with tab1:
-                # Get and display current weather
-                current_weather = get_current_weather(lat, lon, units)
-                if current_weather:
-                    display_current_weather(current_weather, units, city, country, state)
-                else:
-                    st.error("❌ Could not retrieve current weather data. Please try again.")
+                render_current(futures["current"], units, city, country, state)
 
             with tab2:
-                # Get and display forecast
-                forecast = get_forecast(lat, lon, units)
-                if forecast:
-                    display_forecast(forecast, units, forecast_hours)
-                else:
-                    st.error("❌ Could not retrieve forecast data. Please try again.")
+                render_forecast(futures["forecast"], units, forecast_hours)
 
             with tab3:
-                if show_details and current_weather:
-                    st.subheader("📊 Additional Information")
-
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        st.markdown("**🌅 Sun & Moon**")
-                        if "sys" in current_weather:
-                            sunrise = datetime.fromtimestamp(current_weather["sys"]["sunrise"])
-                            sunset = datetime.fromtimestamp(current_weather["sys"]["sunset"])
-
-                            st.write(f"🌅 Sunrise: **{sunrise.strftime('%I:%M %p')}**")
-                            st.write(f"🌇 Sunset: **{sunset.strftime('%I:%M %p')}**")
-
-                            # Check if it's currently day or night
-                            now = datetime.now()
-                            current_time = now.time()
-                            sunrise_time = sunrise.time()
-                            sunset_time = sunset.time()
-
-                            if sunrise_time <= current_time <= sunset_time:
-                                st.write("🌞 Currently: **Daytime**")
-                            else:
-                                st.write("🌙 Currently: **Nighttime**")
-
-                    with col2:
-                        st.markdown("**📍 Location Details**")
-                        st.write(f"📍 Coordinates: **{lat:.4f}, {lon:.4f}**")
-                        if "timezone" in current_weather:
-                            timezone_offset = current_weather["timezone"]
-                            offset_hours = timezone_offset // 3600
-                            st.write(f"🕐 Timezone: **UTC{offset_hours:+d}**")
-
-                else:
-                    st.info("Enable 'Show detailed metrics' in the sidebar to see more information.")
+                render_details(futures["current"], lat, lon, show_details)
         else:
-            st.error("🔍 **Location not found.** Please try a different search term.")
+            if geo_error:
+                st.error(geo_error)
+            else:
+                st.error("🔍 **Location not found.** Please try a different search term.")
 
             # Error help
             st.info("""
@@ -1,5 +1,6 @@
 import os
 from typing import Optional
+import httpx
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -32,7 +33,9 @@ AIR_POLLUTION_URL = "https://api.openweathermap.org/data/2.5/air_pollution"
 # Default settings
 DEFAULT_UNITS = "metric"
 DEFAULT_FORECAST_HOURS = 24
-CACHE_TTL = 300  # 5 minutes cache
+WEATHER_TTL = 300  # 5 minutes cache for live weather data
+GEOCODE_TTL = 86400  # 24 hours; coordinates for a location string rarely change
+ERROR_CACHE_TTL = 30  # remember failed fetches briefly instead of hammering the API
 MAX_FORECAST_DAYS = 5
 
 # API limits and timeouts
@@ -40,6 +43,21 @@ REQUEST_TIMEOUT = 10  # seconds
 MAX_RETRIES = 3
 RATE_LIMIT_DELAY = 1  # seconds between requests
 
+# Shared HTTP client with connection pooling, HTTP/2 multiplexing, and
+# compressed responses. All OpenWeather endpoints live on the same host, so
+# concurrent current+forecast fetches share a single TLS connection and the
+# ~30 KB forecast payload travels gzip/brotli encoded.
+SESSION = httpx.Client(
+    http2=True,
+    timeout=REQUEST_TIMEOUT,
+    headers={
+        "User-Agent": "simple-weather-forecast/0.3",
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, br",
+    },
+    transport=httpx.HTTPTransport(retries=MAX_RETRIES),
+)
+
 # App configuration
 APP_TITLE = "🌤️ Weather Forecast App"
 APP_DESCRIPTION = "Get accurate weather forecasts for any location worldwide"